@@ -0,0 +1,198 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Per-report values come from the JSON block with id "dashboard-data"
+    const dataEl = document.getElementById('dashboard-data');
+    if (!dataEl) {
+        return;
+    }
+    const data = JSON.parse(dataEl.textContent);
+    const stats = data.stats;
+    const errorCategories = data.errorCategories;
+    const animationDuration = data.animation ? 1000 : 0;
+
+    // Chart configuration
+    Chart.defaults.font.family = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif";
+    Chart.defaults.color = '#64748b';
+
+    // Test Status Distribution Chart
+    if (document.getElementById('statusChart')) {
+        const statusCtx = document.getElementById('statusChart').getContext('2d');
+        new Chart(statusCtx, {
+            type: 'doughnut',
+            data: {
+                labels: ['Passed', 'Failed', 'Skipped'],
+                datasets: [{
+                    data: [stats.passed, stats.failed, stats.skipped],
+                    backgroundColor: [
+                        'rgba(76, 175, 80, 0.8)',
+                        'rgba(244, 67, 54, 0.8)',
+                        'rgba(255, 152, 0, 0.8)'
+                    ],
+                    borderColor: [
+                        'rgba(76, 175, 80, 1)',
+                        'rgba(244, 67, 54, 1)',
+                        'rgba(255, 152, 0, 1)'
+                    ],
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: {
+                    legend: {
+                        position: 'bottom',
+                        labels: {
+                            padding: 20,
+                            font: {
+                                size: 13
+                            }
+                        }
+                    },
+                    title: {
+                        display: false
+                    },
+                    tooltip: {
+                        callbacks: {
+                            label: function(context) {
+                                const label = context.label || '';
+                                const value = context.parsed || 0;
+                                const total = stats.total;
+                                const percentage = total > 0 ? ((value / total) * 100).toFixed(1) : 0;
+                                return label + ': ' + value + ' (' + percentage + '%)';
+                            }
+                        }
+                    }
+                },
+                animation: {
+                    animateRotate: data.animation,
+                    animateScale: data.animation
+                }
+            }
+        });
+    }
+
+    // Pass Rate Trend Chart
+    if (document.getElementById('passRateChart')) {
+        const passRateCtx = document.getElementById('passRateChart').getContext('2d');
+
+        new Chart(passRateCtx, {
+            type: 'bar',
+            data: {
+                labels: ['Pass Rate'],
+                datasets: [{
+                    label: 'Passed',
+                    data: [stats.pass_rate],
+                    backgroundColor: 'rgba(76, 175, 80, 0.8)',
+                    borderColor: 'rgba(76, 175, 80, 1)',
+                    borderWidth: 2
+                }, {
+                    label: 'Failed',
+                    data: [stats.not_passed_rate],
+                    backgroundColor: 'rgba(244, 67, 54, 0.8)',
+                    borderColor: 'rgba(244, 67, 54, 1)',
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        max: 100,
+                        ticks: {
+                            callback: function(value) {
+                                return value + '%';
+                            }
+                        },
+                        grid: {
+                            color: 'rgba(0, 0, 0, 0.05)'
+                        }
+                    },
+                    x: {
+                        stacked: true,
+                        grid: {
+                            display: false
+                        }
+                    }
+                },
+                plugins: {
+                    legend: {
+                        position: 'bottom',
+                        labels: {
+                            padding: 20,
+                            font: {
+                                size: 13
+                            }
+                        }
+                    },
+                    tooltip: {
+                        callbacks: {
+                            label: function(context) {
+                                return context.dataset.label + ': ' + context.parsed.y.toFixed(1) + '%';
+                            }
+                        }
+                    }
+                },
+                animation: {
+                    duration: animationDuration
+                }
+            }
+        });
+    }
+
+    // Error Categories Chart
+    if (document.getElementById('errorCategoriesChart')) {
+        const errorCtx = document.getElementById('errorCategoriesChart').getContext('2d');
+
+        new Chart(errorCtx, {
+            type: 'bar',
+            data: {
+                labels: errorCategories.labels,
+                datasets: [{
+                    label: 'Error Count',
+                    data: errorCategories.values,
+                    backgroundColor: 'rgba(244, 67, 54, 0.8)',
+                    borderColor: 'rgba(244, 67, 54, 1)',
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                indexAxis: 'y',
+                responsive: true,
+                maintainAspectRatio: false,
+                scales: {
+                    x: {
+                        beginAtZero: true,
+                        ticks: {
+                            precision: 0
+                        },
+                        grid: {
+                            color: 'rgba(0, 0, 0, 0.05)'
+                        }
+                    },
+                    y: {
+                        grid: {
+                            display: false
+                        }
+                    }
+                },
+                plugins: {
+                    legend: {
+                        display: false
+                    },
+                    tooltip: {
+                        callbacks: {
+                            label: function(context) {
+                                return 'Count: ' + context.parsed.x;
+                            }
+                        }
+                    }
+                },
+                animation: {
+                    duration: animationDuration
+                }
+            }
+        });
+    }
+});
@@ -85,6 +85,7 @@ class ReportConfig:
     show_duration: bool = True
     auto_refresh: bool = False
     refresh_interval: int = 30  # seconds
+    gzip_output: bool = False  # also write <report>.html.gz
 
 
 @dataclass
@@ -8,7 +8,7 @@ Provides detailed error capture, classification, and reporting for test failures
 import re
 import traceback
 import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass, asdict
 
 
@@ -364,15 +364,23 @@ class EnhancedErrorReporter:
             self,
             test_id: str,
             log_content: str = "",
-            exception: Optional[Exception] = None) -> Optional[ErrorDetails]:
-        """Capture and store detailed error information."""
+            exception: Optional[Exception] = None,
+            get_log: Optional[Callable[[], str]] = None) -> Optional[ErrorDetails]:
+        """Capture and store detailed error information.
+
+        ``get_log`` renders the log text on demand; it is only called when
+        there is no exception and no ``log_content`` to classify from.
+        """
         error_details = None
 
         # Try different extraction methods
         if exception:
             error_details = ErrorExtractor.extract_from_exception(exception)
-        elif log_content:
-            error_details = ErrorExtractor.extract_from_pytest_log(log_content)
+        else:
+            if not log_content and get_log is not None:
+                log_content = get_log()
+            if log_content:
+                error_details = ErrorExtractor.extract_from_pytest_log(log_content)
 
         if error_details:
             # Store error details
@@ -391,6 +399,10 @@ class EnhancedErrorReporter:
         """Get all errors for a specific test."""
         return self.error_storage.get(test_id, [])
 
+    def get_all_errors(self) -> Dict[str, List[ErrorDetails]]:
+        """Get captured errors for every test, keyed by test id."""
+        return dict(self.error_storage)
+
     def get_error_summary(self) -> Dict[str, int]:
         """Get error category statistics."""
         return self.error_statistics.copy()
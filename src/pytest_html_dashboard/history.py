@@ -7,6 +7,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 import hashlib
 
+# Applied to every connection; these settings do not persist in the file
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-30000;
+"""
+
 
 class TestHistory:
     """Manages historical test result data storage and retrieval."""
@@ -20,11 +27,25 @@ class TestHistory:
         self.db_path = Path(db_path)
         self._init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection tuning applied.
+
+        WAL (set once in _init_database) plus synchronous=NORMAL avoids an
+        fsync per commit while staying crash-safe; the 5 s timeout is
+        SQLite's busy_timeout when another process holds the write lock.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+
     def _init_database(self):
         """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
+            # Journal mode is stored in the database file, so set it once
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             # Test runs table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS test_runs (
@@ -112,8 +133,13 @@ class TestHistory:
         Returns:
             The run_id of the saved test run
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # Manage the transaction explicitly: take the write lock up front
+            # so the whole run lands in one transaction, committed (or rolled
+            # back by the context manager) once
+            conn.isolation_level = None
             cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
 
             # Extract summary data
             summary = results.get('summary', {})
@@ -140,27 +166,30 @@ class TestHistory:
 
             run_id = cursor.lastrowid
 
-            # Insert individual test results
-            for test in results.get('tests', []):
-                test_id = self._generate_test_id(test.get('name', ''))
-                cursor.execute("""
-                    INSERT INTO test_results
-                    (run_id, test_id, test_name, outcome, duration,
-                     error_message, error_type)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+            # Insert individual test results in one batch
+            rows = [
+                (
                     run_id,
-                    test_id,
+                    self._generate_test_id(test.get('name', '')),
                     test.get('name'),
                     test.get('outcome'),
                     test.get('duration', 0.0),
                     test.get('error_message'),
                     test.get('error_type')
-                ))
-
-                # Update flaky test tracking
+                )
+                for test in results.get('tests', [])
+            ]
+            cursor.executemany("""
+                INSERT INTO test_results
+                (run_id, test_id, test_name, outcome, duration,
+                 error_message, error_type)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+            # Update flaky test tracking
+            for _, test_id, test_name, outcome, *_ in rows:
                 self._update_flaky_detection(
-                    cursor, test_id, test.get('name'), test.get('outcome')
+                    cursor, test_id, test_name, outcome
                 )
 
             conn.commit()
@@ -221,7 +250,7 @@ class TestHistory:
         Returns:
             List of test run summaries
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT run_id, timestamp, total_tests, passed, failed,
@@ -243,7 +272,7 @@ class TestHistory:
         Returns:
             List of flaky test information
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT test_id, test_name, flaky_count, last_flip_date,
@@ -270,7 +299,7 @@ class TestHistory:
         """
         test_id = self._generate_test_id(test_name)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT tr.timestamp, tr.outcome, tr.duration,
@@ -290,7 +319,7 @@ class TestHistory:
         Returns:
             Dictionary with various statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             # Total runs
@@ -347,44 +376,35 @@ class TestHistory:
         Returns:
             Dictionary with trend metrics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
-            # Total runs
+            # All trend metrics are aggregated by SQLite in a single statement:
+            # one scan of test_runs splits recent/older runs around the cutoff
             cursor.execute("""
-                SELECT COUNT(*) FROM test_runs
-                WHERE timestamp >= datetime('now', '-' || ? || ' days')
+                WITH cutoff AS (
+                    SELECT datetime('now', '-' || ? || ' days') AS ts
+                )
+                SELECT
+                    COUNT(CASE WHEN r.timestamp >= cutoff.ts THEN 1 END),
+                    AVG(CASE WHEN r.timestamp >= cutoff.ts
+                        THEN CAST(r.passed AS REAL) / NULLIF(r.total_tests, 0) * 100 END),
+                    AVG(CASE WHEN r.timestamp < cutoff.ts
+                        THEN CAST(r.passed AS REAL) / NULLIF(r.total_tests, 0) * 100 END),
+                    (SELECT COUNT(*) FROM flaky_tests),
+                    (SELECT AVG(duration) FROM test_results
+                     WHERE run_id IN (
+                         SELECT run_id FROM test_runs
+                         WHERE timestamp >= (SELECT ts FROM cutoff)
+                     ))
+                FROM test_runs r, cutoff
             """, (days,))
-            total_runs = cursor.fetchone()[0]
+            total_runs, recent_rate, old_rate, flaky_count, avg_duration = cursor.fetchone()
 
-            # Pass rate change (calculate from passed/total_tests)
-            cursor.execute("""
-                SELECT
-                    AVG(CASE WHEN timestamp >= datetime('now', '-' || ? || ' days')
-                        THEN CAST(passed AS REAL) / NULLIF(total_tests, 0) * 100 ELSE NULL END) as recent,
-                    AVG(CASE WHEN timestamp < datetime('now', '-' || ? || ' days')
-                        THEN CAST(passed AS REAL) / NULLIF(total_tests, 0) * 100 ELSE NULL END) as old
-                FROM test_runs
-                WHERE total_tests > 0
-            """, (days, days))
-            row = cursor.fetchone()
-            recent_rate = row[0] or 0
-            old_rate = row[1] or recent_rate
+            recent_rate = recent_rate or 0
+            old_rate = old_rate or recent_rate
             pass_rate_change = recent_rate - old_rate
-
-            # Flaky tests count
-            cursor.execute("SELECT COUNT(*) FROM flaky_tests")
-            flaky_count = cursor.fetchone()[0]
-
-            # Average duration
-            cursor.execute("""
-                SELECT AVG(duration) FROM test_results
-                WHERE run_id IN (
-                    SELECT run_id FROM test_runs
-                    WHERE timestamp >= datetime('now', '-' || ? || ' days')
-                )
-            """, (days,))
-            avg_duration = cursor.fetchone()[0] or 0.0
+            avg_duration = avg_duration or 0.0
 
             return {
                 "total_runs": total_runs,
@@ -399,7 +419,7 @@ class TestHistory:
         Args:
             days: Number of days to retain
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 DELETE FROM test_results
@@ -3,12 +3,154 @@
 """
 HTML generation and enhancement for pytest-html-dashboard
 Provides Chart.js integration, modern styling, and enhanced visualizations
+
+Deprecated: the plugin renders reports with
+pytest_html_dashboard.html_generator and never imports this module. It is
+kept only for code that imports it directly and will be removed in a
+future release.
 """
 
+import contextlib
+import functools
+import gzip
+import io
+import json
 import os
 import re
-from typing import Dict, Any, List, Optional
+import warnings
+from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
+from json.encoder import encode_basestring_ascii
 from datetime import datetime
+from html import escape
+from pathlib import Path
+
+warnings.warn(
+    "pytest_html_dashboard.html_generator_old_backup is deprecated; use "
+    "pytest_html_dashboard.html_generator.enhance_html_report_dashboard instead",
+    DeprecationWarning,
+    stacklevel=2,
+)
+
+
+# Comprehensive table markup; the shell is constant and each row is filled
+# from one precompiled %-template. Row values (test ids and error text) and
+# branding strings are HTML-escaped; the stylesheet and chart script are
+# trusted literals
+_TABLE_HEAD_HTML = """
+        <h2 class="section-header">📋 Detailed Test Results</h2>
+        <div class="comprehensive-table-container">
+            <table class="comprehensive-table">
+                <thead>
+                    <tr>
+                        <th>Test Case</th>
+                        <th>Status</th>
+                        <th>Duration</th>
+                        <th>Error Category</th>
+                        <th>Error Details</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    """
+
+_TABLE_ROW_TMPL = """
+            <tr>
+                <td>%s</td>
+                <td><span class="status-badge %s">%s</span></td>
+                <td><span class="duration">%.3fs</span></td>
+                <td><span class="error-category">%s</span></td>
+                <td>%s</td>
+            </tr>
+            """
+
+# (class, label) per known outcome and the cells of a row with no error
+_OUTCOME_BADGES = {
+    'passed': ('passed', 'PASSED'),
+    'failed': ('failed', 'FAILED'),
+    'skipped': ('skipped', 'SKIPPED'),
+    'error': ('error', 'ERROR'),
+    'unknown': ('unknown', 'UNKNOWN'),
+}
+_NO_ERROR_CELLS = ("N/A", "")
+
+_TABLE_TAIL_HTML = """
+                </tbody>
+            </table>
+        </div>
+        """
+
+# Tables with at least _DEFERRED_MIN_ROWS rows render only the first
+# _DEFERRED_INITIAL_ROWS as HTML; the rest are shipped as a JSON array of row
+# markup and mounted in batches as the reader scrolls towards the end
+_DEFERRED_MIN_ROWS = 200
+_DEFERRED_INITIAL_ROWS = 50
+_DEFERRED_ROWS_OPEN = '<script id="dashboard-deferred-rows" type="application/json">['
+_DEFERRED_ROWS_CLOSE = """]</script>
+        <script>
+        (function() {
+            const source = document.getElementById('dashboard-deferred-rows');
+            const tbody = document.querySelector('.comprehensive-table tbody');
+            if (!source || !tbody) return;
+            let rows = null;
+
+            function mountRows(count) {
+                if (rows === null) rows = JSON.parse(source.textContent);
+                tbody.insertAdjacentHTML('beforeend', rows.splice(0, count).join(''));
+                if (!rows.length) window.removeEventListener('scroll', onScroll);
+            }
+
+            function onScroll() {
+                if (window.innerHeight + window.scrollY >= document.body.offsetHeight - 600) {
+                    mountRows(50);
+                }
+            }
+
+            window.addEventListener('scroll', onScroll, { passive: true });
+            // Printing should include every row
+            window.addEventListener('beforeprint', function() { mountRows(Infinity); });
+        })();
+        </script>
+        """
+
+# Standalone document scaffolding written around the streamed sections
+_STANDALONE_HEAD_TMPL = """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>%s</title>
+        """
+_STANDALONE_BODY_OPEN = """
+    </head>
+    <body>
+        """
+_STANDALONE_SECTION_SEP = """
+        """
+_STANDALONE_TAIL = """
+    </body>
+    </html>
+    """
+
+# Every result recorded by the plugin carries 'outcome' and 'duration', so
+# they are read by subscript rather than dict.get with a fallback
+_outcome_of = itemgetter('outcome')
+
+# enhance_html_report looks for </body> within this many trailing bytes first
+_BODY_TAIL_WINDOW = 8192
+
+# Static assets shipped as package data. Branding variables and chart height
+# are substituted into the stylesheet's placeholders; the chart script is
+# embedded verbatim and reads its values from the "dashboard-data" JSON block
+_ASSETS_DIR = Path(__file__).with_name('assets')
+
+
+@functools.lru_cache(maxsize=4)
+def _load_asset(name: str) -> str:
+    """Read a packaged asset once per process."""
+    return (_ASSETS_DIR / name).read_text(encoding='utf-8')
 
 
 class HTMLGenerator:
@@ -22,296 +164,19 @@ class HTMLGenerator:
 
     def generate_custom_css(self) -> str:
         """Generate custom CSS with branding colors."""
-        branding = self.config.branding
+        return self._custom_css(
+            self.config.branding.to_css_vars(), self.config.charts.chart_height)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _custom_css(css_vars: str, chart_height: int) -> str:
+        """Build the stylesheet once per branding/chart-height combination."""
+        css = (_load_asset('dashboard.css')
+               .replace('/*__BRANDING_VARS__*/', css_vars)
+               .replace('__CHART_HEIGHT__', str(chart_height)))
         return f"""
         <style>
-        {branding.to_css_vars()}
-
-        /* Modern Dashboard Styling */
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: #f5f7fa;
-            color: #2c3e50;
-            line-height: 1.6;
-            margin: 0;
-            padding: 0;
-        }}
-
-        .dashboard-header {{
-            background: linear-gradient(135deg, var(--primary-color), var(--secondary-color));
-            color: white;
-            padding: 2rem;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        }}
-
-        .dashboard-header h1 {{
-            margin: 0;
-            font-size: 2rem;
-            font-weight: 600;
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-        }}
-
-        .dashboard-logo {{
-            max-height: 50px;
-            max-width: 150px;
-        }}
-
-        .dashboard-summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 1.5rem;
-            padding: 2rem;
-            max-width: 1400px;
-            margin: 0 auto;
-        }}
-
-        .summary-card {{
-            background: white;
-            border-radius: 12px;
-            padding: 1.5rem;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-
-        .summary-card:hover {{
-            transform: translateY(-4px);
-            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.12);
-        }}
-
-        .summary-card-header {{
-            font-size: 0.875rem;
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            margin-bottom: 0.5rem;
-            font-weight: 600;
-        }}
-
-        .summary-card-value {{
-            font-size: 2.5rem;
-            font-weight: 700;
-            margin: 0.5rem 0;
-        }}
-
-        .summary-card-footer {{
-            font-size: 0.875rem;
-            color: #94a3b8;
-            margin-top: 0.5rem;
-        }}
-
-        .summary-card.passed .summary-card-value {{
-            color: var(--success-color);
-        }}
-
-        .summary-card.failed .summary-card-value {{
-            color: var(--failure-color);
-        }}
-
-        .summary-card.skipped .summary-card-value {{
-            color: var(--warning-color);
-        }}
-
-        .summary-card.total .summary-card-value {{
-            color: var(--primary-color);
-        }}
-
-        .chart-container {{
-            background: white;
-            border-radius: 12px;
-            padding: 2rem;
-            margin: 1.5rem 2rem;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            max-width: 1400px;
-            margin-left: auto;
-            margin-right: auto;
-        }}
-
-        .chart-title {{
-            font-size: 1.25rem;
-            font-weight: 600;
-            margin-bottom: 1.5rem;
-            color: #1e293b;
-        }}
-
-        .chart-wrapper {{
-            position: relative;
-            height: {self.config.charts.chart_height}px;
-            margin-bottom: 2rem;
-        }}
-
-        .charts-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 2rem;
-            padding: 0 2rem;
-            max-width: 1400px;
-            margin: 0 auto;
-        }}
-
-        .comprehensive-table-container {{
-            background: white;
-            border-radius: 12px;
-            padding: 2rem;
-            margin: 2rem;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            overflow-x: auto;
-            max-width: 1400px;
-            margin-left: auto;
-            margin-right: auto;
-        }}
-
-        .comprehensive-table {{
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 0.9rem;
-        }}
-
-        .comprehensive-table thead {{
-            background: linear-gradient(135deg, var(--primary-color), var(--secondary-color));
-            color: white;
-        }}
-
-        .comprehensive-table th {{
-            padding: 1rem;
-            text-align: left;
-            font-weight: 600;
-            text-transform: uppercase;
-            font-size: 0.75rem;
-            letter-spacing: 0.05em;
-        }}
-
-        .comprehensive-table td {{
-            padding: 0.875rem 1rem;
-            border-bottom: 1px solid #e2e8f0;
-        }}
-
-        .comprehensive-table tbody tr:hover {{
-            background: #f8fafc;
-        }}
-
-        .status-badge {{
-            display: inline-block;
-            padding: 0.25rem 0.75rem;
-            border-radius: 12px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-
-        .status-badge.passed {{
-            background: #dcfce7;
-            color: #166534;
-        }}
-
-        .status-badge.failed {{
-            background: #fee2e2;
-            color: #991b1b;
-        }}
-
-        .status-badge.skipped {{
-            background: #fef3c7;
-            color: #92400e;
-        }}
-
-        .error-category {{
-            display: inline-block;
-            padding: 0.25rem 0.625rem;
-            background: #f1f5f9;
-            border-radius: 6px;
-            font-size: 0.75rem;
-            color: #475569;
-            font-family: 'Monaco', 'Courier New', monospace;
-        }}
-
-        .error-message {{
-            font-family: 'Monaco', 'Courier New', monospace;
-            font-size: 0.8rem;
-            color: #dc2626;
-            background: #fef2f2;
-            padding: 0.5rem;
-            border-radius: 6px;
-            border-left: 3px solid #dc2626;
-            max-width: 500px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-        }}
-
-        .duration {{
-            font-family: 'Monaco', 'Courier New', monospace;
-            font-size: 0.85rem;
-            color: #64748b;
-        }}
-
-        .section-header {{
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin: 2rem 2rem 1rem;
-            color: #1e293b;
-            border-bottom: 2px solid var(--primary-color);
-            padding-bottom: 0.5rem;
-            max-width: 1400px;
-            margin-left: auto;
-            margin-right: auto;
-        }}
-
-        /* Responsive Design */
-        @media (max-width: 768px) {{
-            .dashboard-summary {{
-                grid-template-columns: 1fr;
-                padding: 1rem;
-            }}
-
-            .charts-grid {{
-                grid-template-columns: 1fr;
-                padding: 0 1rem;
-            }}
-
-            .comprehensive-table-container {{
-                margin: 1rem;
-                padding: 1rem;
-            }}
-
-            .chart-wrapper {{
-                height: 250px;
-            }}
-        }}
-
-        /* Custom scrollbar */
-        ::-webkit-scrollbar {{
-            width: 8px;
-            height: 8px;
-        }}
-
-        ::-webkit-scrollbar-track {{
-            background: #f1f5f9;
-        }}
-
-        ::-webkit-scrollbar-thumb {{
-            background: #cbd5e1;
-            border-radius: 4px;
-        }}
-
-        ::-webkit-scrollbar-thumb:hover {{
-            background: #94a3b8;
-        }}
-
-        /* Print styles */
-        @media print {{
-            .dashboard-header {{
-                background: var(--primary-color) !important;
-                -webkit-print-color-adjust: exact;
-                print-color-adjust: exact;
-            }}
-
-            .summary-card, .chart-container, .comprehensive-table-container {{
-                box-shadow: none;
-                page-break-inside: avoid;
-            }}
-        }}
-        </style>
+{css}        </style>
         """
 
     def generate_chartjs_script(self) -> str:
@@ -319,227 +184,58 @@ class HTMLGenerator:
         if not self.config.charts.enable_charts:
             return ""
 
-        # Calculate test statistics
-        stats = self._calculate_test_stats()
+        # Only the numbers vary per report; the chart code is a static asset
+        stats = self.stats
+        payload = json.dumps({
+            'stats': {
+                'total': stats['total'],
+                'passed': stats['passed'],
+                'failed': stats['failed'],
+                'skipped': stats['skipped'],
+                'pass_rate': round(stats['pass_rate'], 1),
+                'not_passed_rate': round(100 - stats['pass_rate'], 1),
+            },
+            'errorCategories': self._get_error_categories_data(),
+            'animation': bool(self.config.charts.chart_animation),
+        }).replace('</', '<\\/')
 
         return f"""
         <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
+        <script id="dashboard-data" type="application/json">{payload}</script>
         <script>
-        document.addEventListener('DOMContentLoaded', function() {{
-            // Chart configuration
-            Chart.defaults.font.family = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif";
-            Chart.defaults.color = '#64748b';
-
-            // Test Status Distribution Chart
-            if (document.getElementById('statusChart')) {{
-                const statusCtx = document.getElementById('statusChart').getContext('2d');
-                new Chart(statusCtx, {{
-                    type: 'doughnut',
-                    data: {{
-                        labels: ['Passed', 'Failed', 'Skipped'],
-                        datasets: [{{
-                            data: [{stats['passed']}, {stats['failed']}, {stats['skipped']}],
-                            backgroundColor: [
-                                'rgba(76, 175, 80, 0.8)',
-                                'rgba(244, 67, 54, 0.8)',
-                                'rgba(255, 152, 0, 0.8)'
-                            ],
-                            borderColor: [
-                                'rgba(76, 175, 80, 1)',
-                                'rgba(244, 67, 54, 1)',
-                                'rgba(255, 152, 0, 1)'
-                            ],
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            legend: {{
-                                position: 'bottom',
-                                labels: {{
-                                    padding: 20,
-                                    font: {{
-                                        size: 13
-                                    }}
-                                }}
-                            }},
-                            title: {{
-                                display: false
-                            }},
-                            tooltip: {{
-                                callbacks: {{
-                                    label: function(context) {{
-                                        const label = context.label || '';
-                                        const value = context.parsed || 0;
-                                        const total = {stats['total']};
-                                        const percentage = total > 0 ? ((value / total) * 100).toFixed(1) : 0;
-                                        return label + ': ' + value + ' (' + percentage + '%)';
-                                    }}
-                                }}
-                            }}
-                        }},
-                        animation: {{
-                            animateRotate: {str(self.config.charts.chart_animation).lower()},
-                            animateScale: {str(self.config.charts.chart_animation).lower()}
-                        }}
-                    }}
-                }});
-            }}
-
-            // Pass Rate Trend Chart
-            if (document.getElementById('passRateChart')) {{
-                const passRate = {stats['pass_rate']:.1f};
-                const passRateCtx = document.getElementById('passRateChart').getContext('2d');
-
-                new Chart(passRateCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: ['Pass Rate'],
-                        datasets: [{{
-                            label: 'Passed',
-                            data: [passRate],
-                            backgroundColor: 'rgba(76, 175, 80, 0.8)',
-                            borderColor: 'rgba(76, 175, 80, 1)',
-                            borderWidth: 2
-                        }}, {{
-                            label: 'Failed',
-                            data: [{100 - stats['pass_rate']:.1f}],
-                            backgroundColor: 'rgba(244, 67, 54, 0.8)',
-                            borderColor: 'rgba(244, 67, 54, 1)',
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        scales: {{
-                            y: {{
-                                beginAtZero: true,
-                                max: 100,
-                                ticks: {{
-                                    callback: function(value) {{
-                                        return value + '%';
-                                    }}
-                                }},
-                                grid: {{
-                                    color: 'rgba(0, 0, 0, 0.05)'
-                                }}
-                            }},
-                            x: {{
-                                stacked: true,
-                                grid: {{
-                                    display: false
-                                }}
-                            }}
-                        }},
-                        plugins: {{
-                            legend: {{
-                                position: 'bottom',
-                                labels: {{
-                                    padding: 20,
-                                    font: {{
-                                        size: 13
-                                    }}
-                                }}
-                            }},
-                            tooltip: {{
-                                callbacks: {{
-                                    label: function(context) {{
-                                        return context.dataset.label + ': ' + context.parsed.y.toFixed(1) + '%';
-                                    }}
-                                }}
-                            }}
-                        }},
-                        animation: {{
-                            duration: {1000 if self.config.charts.chart_animation else 0}
-                        }}
-                    }}
-                }});
-            }}
-
-            // Error Categories Chart
-            if (document.getElementById('errorCategoriesChart')) {{
-                const errorCategories = {self._get_error_categories_data()};
-                const errorCtx = document.getElementById('errorCategoriesChart').getContext('2d');
-
-                new Chart(errorCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: errorCategories.labels,
-                        datasets: [{{
-                            label: 'Error Count',
-                            data: errorCategories.values,
-                            backgroundColor: 'rgba(244, 67, 54, 0.8)',
-                            borderColor: 'rgba(244, 67, 54, 1)',
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        indexAxis: 'y',
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        scales: {{
-                            x: {{
-                                beginAtZero: true,
-                                ticks: {{
-                                    precision: 0
-                                }},
-                                grid: {{
-                                    color: 'rgba(0, 0, 0, 0.05)'
-                                }}
-                            }},
-                            y: {{
-                                grid: {{
-                                    display: false
-                                }}
-                            }}
-                        }},
-                        plugins: {{
-                            legend: {{
-                                display: false
-                            }},
-                            tooltip: {{
-                                callbacks: {{
-                                    label: function(context) {{
-                                        return 'Count: ' + context.parsed.x;
-                                    }}
-                                }}
-                            }}
-                        }},
-                        animation: {{
-                            duration: {1000 if self.config.charts.chart_animation else 0}
-                        }}
-                    }}
-                }});
-            }}
-        }});
-        </script>
+{_load_asset('dashboard-charts.js')}        </script>
         """
 
     def generate_dashboard_header(self) -> str:
         """Generate dashboard header with branding."""
         branding = self.config.branding
+        return self._dashboard_header(
+            branding.logo_url, branding.report_title, branding.company_name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _dashboard_header(logo_url: Optional[str], report_title: str,
+                          company_name: str) -> str:
+        """Build the header once per branding combination."""
         logo_html = ""
 
-        if branding.logo_url:
+        if logo_url:
             logo_html = f'<img src="{
-                branding.logo_url}" alt="Logo" class="dashboard-logo" />'
+                escape(logo_url)}" alt="Logo" class="dashboard-logo" />'
 
         return f"""
         <div class="dashboard-header">
             <h1>
                 {logo_html}
-                <span>{branding.report_title}</span>
+                <span>{escape(report_title)}</span>
             </h1>
-            <p style="margin: 0.5rem 0 0; opacity: 0.9;">{branding.company_name}</p>
+            <p style="margin: 0.5rem 0 0; opacity: 0.9;">{escape(company_name)}</p>
         </div>
         """
 
     def generate_summary_cards(self) -> str:
         """Generate summary statistics cards."""
-        stats = self._calculate_test_stats()
+        stats = self.stats
 
         return f"""
         <div class="dashboard-summary">
@@ -595,7 +291,7 @@ class HTMLGenerator:
             """
 
         # Add error categories chart if there are failures
-        stats = self._calculate_test_stats()
+        stats = self.stats
         if stats['failed'] > 0:
             charts_html += """
             <div class="chart-container" style="grid-column: span 2;">
@@ -611,77 +307,81 @@ class HTMLGenerator:
 
     def generate_comprehensive_test_table(self) -> str:
         """Generate comprehensive test results table."""
-        if not self.config.report.enable_comprehensive_table:
-            return ""
-
-        table_rows = []
-
-        for test_id, result in self.test_results.items():
-            outcome = result.get('outcome', 'unknown')
-            duration = result.get('duration', 0.0)
+        return ''.join(self.iter_comprehensive_test_table())
 
-            # Get error information if test failed
-            error_info = ""
-            error_category = "N/A"
-            suggested_action = ""
-
-            if outcome == 'failed' and self.error_reporter:
-                error_list = self.error_reporter.get_test_errors(test_id)
-                if error_list and len(error_list) > 0:
-                    error_data = error_list[0]  # Get first error
-                    error_category = error_data.error_category
-                    error_message = error_data.error_message or ""
-                    suggested_action = error_data.suggested_action or ""
-
-                    # Truncate long error messages
-                    max_length = self.config.report.max_error_message_length
-                    if len(error_message) > max_length:
-                        error_message = error_message[:max_length] + "..."
-
-                    error_info = f'<div class="error-message" title="{error_message}">{error_message}</div>'
-                    if suggested_action:
-                        error_info += f'<div style="font-size: 0.75rem; color: #64748b; margin-top: 0.25rem;">💡 {suggested_action}</div>'
-
-            status_class = outcome.lower()
-            table_rows.append(f"""
-            <tr>
-                <td>{test_id}</td>
-                <td><span class="status-badge {status_class}">{outcome.upper()}</span></td>
-                <td><span class="duration">{duration:.3f}s</span></td>
-                <td><span class="error-category">{error_category}</span></td>
-                <td>{error_info}</td>
-            </tr>
-            """)
-
-        return f"""
-        <h2 class="section-header">📋 Detailed Test Results</h2>
-        <div class="comprehensive-table-container">
-            <table class="comprehensive-table">
-                <thead>
-                    <tr>
-                        <th>Test Case</th>
-                        <th>Status</th>
-                        <th>Duration</th>
-                        <th>Error Category</th>
-                        <th>Error Details</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {''.join(table_rows)}
-                </tbody>
-            </table>
-        </div>
-        """
+    def iter_comprehensive_test_table(self):
+        """Yield the comprehensive table markup one row at a time."""
+        if not self.config.report.enable_comprehensive_table:
+            return
+
+        # Only failed tests carry error cells; build those up front so the
+        # per-row expression is a couple of dict lookups and one %-format
+        max_length = self.config.report.max_error_message_length
+        error_cells = {
+            test_id: self._error_cells(error_data, max_length)
+            for test_id, error_data in self._failed_error_index.items()
+        }
+        badges = _OUTCOME_BADGES
+
+        rows = (
+            _TABLE_ROW_TMPL % (
+                (escape(test_id),)
+                + (badges.get(outcome := result['outcome'])
+                   or (outcome.lower(), outcome.upper()))
+                + (result['duration'],)
+                + error_cells.get(test_id, _NO_ERROR_CELLS))
+            for test_id, result in self.test_results.items()
+        )
 
-    def _calculate_test_stats(self) -> Dict[str, Any]:
-        """Calculate test statistics."""
+        yield _TABLE_HEAD_HTML
+        if len(self.test_results) < _DEFERRED_MIN_ROWS:
+            yield from rows
+            yield _TABLE_TAIL_HTML
+            return
+
+        # Large tables: first rows as HTML, the remainder deferred as JSON
+        yield from islice(rows, _DEFERRED_INITIAL_ROWS)
+        yield _TABLE_TAIL_HTML
+        yield _DEFERRED_ROWS_OPEN
+        # Rows are plain strings, so the C string encoder behind json.dumps is
+        # called directly rather than going through the encoder per row
+        separator = ''
+        for row in rows:
+            yield separator
+            yield encode_basestring_ascii(row).replace('</', '<\\/')
+            separator = ','
+        yield _DEFERRED_ROWS_CLOSE
+
+    @staticmethod
+    def _error_cells(error_data, max_length: int) -> Tuple[str, str]:
+        """Escaped (category, details) cells for a failed test's first error."""
+        return HTMLGenerator._format_error_cells(
+            error_data.error_category, error_data.error_message or "",
+            error_data.suggested_action or "", max_length)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_error_cells(error_category: str, error_message: str,
+                            suggested_action: str, max_length: int) -> Tuple[str, str]:
+        # Memoized on the raw strings, so failures sharing a category and
+        # message reuse one escaped fragment instead of rebuilding it per row
+        error_message = escape(
+            error_message if len(error_message) <= max_length
+            else f"{error_message[:max_length]}...")
+
+        error_info = f'<div class="error-message" title="{error_message}">{error_message}</div>'
+        if suggested_action:
+            error_info += f'<div style="font-size: 0.75rem; color: #64748b; margin-top: 0.25rem;">💡 {escape(suggested_action)}</div>'
+        return escape(error_category), error_info
+
+    @functools.cached_property
+    def stats(self) -> Dict[str, Any]:
+        """Test statistics, counted in one pass and computed once per generator."""
         total = len(self.test_results)
-        passed = sum(1 for r in self.test_results.values()
-                     if r.get('outcome') == 'passed')
-        failed = sum(1 for r in self.test_results.values()
-                     if r.get('outcome') == 'failed')
-        skipped = sum(1 for r in self.test_results.values()
-                      if r.get('outcome') == 'skipped')
+        counts = Counter(map(_outcome_of, self.test_results.values()))
+        passed = counts['passed']
+        failed = counts['failed']
+        skipped = counts['skipped']
 
         pass_rate = (passed / total * 100) if total > 0 else 0
         fail_rate = (failed / total * 100) if total > 0 else 0
@@ -697,49 +397,58 @@ class HTMLGenerator:
             'skip_rate': skip_rate
         }
 
-    def _get_error_categories_data(self) -> str:
-        """Get error categories data for chart."""
+    @functools.cached_property
+    def _failed_error_index(self) -> Dict[str, Any]:
+        """Map each failed test to its first captured error, looked up once."""
         if not self.error_reporter:
-            return "{ labels: [], values: [] }"
+            return {}
 
-        categories = {}
+        index = {}
         for test_id, result in self.test_results.items():
-            if result.get('outcome') == 'failed':
+            if result['outcome'] == 'failed':
                 error_list = self.error_reporter.get_test_errors(test_id)
-                if error_list and len(error_list) > 0:
-                    error_data = error_list[0]  # Get first error
-                    category = error_data.error_category
-                    categories[category] = categories.get(category, 0) + 1
+                if error_list:
+                    index[test_id] = error_list[0]  # Get first error
+        return index
 
-        labels = list(categories.keys())
-        values = list(categories.values())
+    @functools.cached_property
+    def _error_category_counts(self) -> Counter:
+        """Count failed tests per error category."""
+        return Counter(error.error_category for error in self._failed_error_index.values())
 
-        return f"{{ labels: {labels}, values: {values} }}"
+    def _get_error_categories_data(self) -> Dict[str, List[Any]]:
+        """Get error categories data for chart."""
+        categories = self._error_category_counts
+        return {'labels': list(categories), 'values': list(categories.values())}
 
     def generate_enhanced_html(self) -> str:
         """Generate complete enhanced HTML content."""
-        html_parts = []
+        return ''.join(self.iter_parts())
 
+    def iter_parts(self):
+        """Yield the enhanced HTML content piece by piece, sections separated by newlines."""
         # Add custom CSS
-        html_parts.append(self.generate_custom_css())
+        yield self.generate_custom_css()
+        yield '\n'
 
         # Add dashboard header
-        html_parts.append(self.generate_dashboard_header())
+        yield self.generate_dashboard_header()
+        yield '\n'
 
         # Add summary cards
-        html_parts.append(self.generate_summary_cards())
+        yield self.generate_summary_cards()
+        yield '\n'
 
         # Add charts section
-        html_parts.append(self.generate_charts_section())
+        yield self.generate_charts_section()
+        yield '\n'
 
-        # Add comprehensive test table
-        html_parts.append(self.generate_comprehensive_test_table())
+        # Add comprehensive test table, row by row
+        yield from self.iter_comprehensive_test_table()
+        yield '\n'
 
         # Add Chart.js script
-        html_parts.append(self.generate_chartjs_script())
-
-        return '\n'.join(html_parts)
-
+        yield self.generate_chartjs_script()
 
 def enhance_html_report(html_path: str, config,
                         test_results: Dict[str, Any], error_reporter):
@@ -755,31 +464,46 @@ def enhance_html_report(html_path: str, config,
     if not os.path.exists(html_path):
         raise FileNotFoundError(f"HTML report not found: {html_path}")
 
-    # Read existing HTML
-    with open(html_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-
-    # Generate enhanced content
     generator = HTMLGenerator(config, test_results, error_reporter)
-    enhanced_html = generator.generate_enhanced_html()
-
-    # Find insertion point (before </body> tag)
-    insertion_point = html_content.rfind('</body>')
-
-    if insertion_point != -1:
-        # Insert enhanced content before </body>
-        enhanced_content = (
-            html_content[:insertion_point] +
-            enhanced_html +
-            html_content[insertion_point:]
-        )
-    else:
-        # If no </body> tag, append to end
-        enhanced_content = html_content + enhanced_html
 
-    # Write enhanced HTML back
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(enhanced_content)
+    # Render into a sibling temp file and swap it in, so a failure part way
+    # through never leaves the original report corrupted
+    tmp_path = html_path + '.tmp'
+    try:
+        with open(html_path, 'rb') as src, open(tmp_path, 'wb') as out:
+            # Find insertion point (before </body> tag) in the file tail only;
+            # fall back to the whole file, then to appending at the end
+            size = src.seek(0, os.SEEK_END)
+            tail_start = max(0, size - _BODY_TAIL_WINDOW)
+            src.seek(tail_start)
+            tail = src.read()
+            index = tail.rfind(b'</body>')
+            if index == -1 and tail_start > 0:
+                src.seek(0)
+                tail_start = 0
+                tail = src.read()
+                index = tail.rfind(b'</body>')
+            if index == -1:
+                index = len(tail)
+
+            # Copy the original up to the insertion point, then the enhanced
+            # content, then the original tail
+            src.seek(0)
+            remaining = tail_start + index
+            while remaining:
+                chunk = src.read(min(remaining, 1 << 20))
+                out.write(chunk)
+                remaining -= len(chunk)
+            text = io.TextIOWrapper(out, encoding='utf-8')
+            text.writelines(generator.iter_parts())
+            text.flush()
+            text.detach()
+            out.write(tail[index:])
+        os.replace(tmp_path, html_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
 
 
 def generate_standalone_report(
@@ -795,24 +519,59 @@ def generate_standalone_report(
     """
     generator = HTMLGenerator(config, test_results, error_reporter)
 
-    html_template = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{config.branding.report_title}</title>
-        {generator.generate_custom_css()}
-    </head>
-    <body>
-        {generator.generate_dashboard_header()}
-        {generator.generate_summary_cards()}
-        {generator.generate_charts_section()}
-        {generator.generate_comprehensive_test_table()}
-        {generator.generate_chartjs_script()}
-    </body>
-    </html>
-    """
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_template)
+    # Stream each section to disk instead of assembling one document string;
+    # the 1 MiB buffer coalesces the many small row writes into few syscalls
+    # Both files are written to temp paths and swapped in, so a failure part
+    # way through never leaves a truncated report or .gz copy behind
+    parts = _iter_standalone_parts(generator, config)
+    tmp_path = output_path + '.tmp'
+    gz_tmp_path = output_path + '.gz.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            if not config.report.gzip_output:
+                f.writelines(parts)
+            else:
+                # Compress alongside the plain report, one section at a time
+                with gzip.open(gz_tmp_path, 'wt', encoding='utf-8', compresslevel=6) as gz:
+                    for part in parts:
+                        f.write(part)
+                        gz.write(part)
+        if config.report.gzip_output:
+            os.replace(gz_tmp_path, output_path + '.gz')
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        for path in (tmp_path, gz_tmp_path):
+            with contextlib.suppress(OSError):
+                os.remove(path)
+        raise
+
+
+def _iter_standalone_parts(generator: HTMLGenerator, config):
+    """Yield the standalone document: scaffolding around the generator's sections."""
+    branding = config.branding
+    yield _standalone_skeleton_head(
+        branding.report_title, branding.logo_url, branding.company_name,
+        branding.to_css_vars(), config.charts.chart_height)
+    yield generator.generate_summary_cards()
+    yield _STANDALONE_SECTION_SEP
+    yield generator.generate_charts_section()
+    yield _STANDALONE_SECTION_SEP
+    yield from generator.iter_comprehensive_test_table()
+    yield _STANDALONE_SECTION_SEP
+    yield generator.generate_chartjs_script()
+    yield _STANDALONE_TAIL
+
+
+@functools.lru_cache(maxsize=8)
+def _standalone_skeleton_head(report_title: str, logo_url: Optional[str],
+                              company_name: str, css_vars: str,
+                              chart_height: int) -> str:
+    """Document head, stylesheet and header: everything before the first
+    data-dependent section, prebuilt once per branding as a single string."""
+    return ''.join((
+        _STANDALONE_HEAD_TMPL % escape(report_title),
+        HTMLGenerator._custom_css(css_vars, chart_height),
+        _STANDALONE_BODY_OPEN,
+        HTMLGenerator._dashboard_header(logo_url, report_title, company_name),
+        _STANDALONE_SECTION_SEP,
+    ))
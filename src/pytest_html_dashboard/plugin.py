@@ -7,22 +7,130 @@ Pytest hooks for dashboard-style HTML reports
 
 import pytest
 import os
+import queue
+import sys
+import threading
 import time
-from typing import Dict, Any, Optional
+import traceback
+from collections import Counter
+from html import escape
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 from .config import ReporterConfig
-from .error_reporting import ErrorClassifier, EnhancedErrorReporter
-from .html_generator import enhance_html_report_dashboard
-from .history import TestHistory
+from .error_reporting import EnhancedErrorReporter
+
+# The report generator and history store are imported by the hooks that use
+# them, so runs without --html or history tracking never load them
+if TYPE_CHECKING:
+    from .history import TestHistory
+
+# Global state for collecting test results: one compact
+# (outcome, duration, start, stop) tuple per node id, expanded into the
+# generator's record dicts only when a report is built
+_test_results: Dict[str, Tuple[str, float, float, float]] = {}
+_history_tracker: Optional["TestHistory"] = None
+_error_reporter: Optional[EnhancedErrorReporter] = None
+_collecting = False  # set by pytest_configure; gates pytest_runtest_makereport
+_classify_errors = True
+
+# pytest-html result table cells; most rows carry no error and share _NA_CELL
+_CELL_TMPL = '<td>%s</td>'
+_NA_CELL = '<td>N/A</td>'
+
+# Options read by pytest_configure
+_CLI_OPTIONS = (
+    "dashboard_config",
+    "dashboard_company_name",
+    "dashboard_report_title",
+    "dashboard_logo_url",
+    "dashboard_charts",
+    "dashboard_error_classification",
+    "enable_history",
+    "disable_history",
+    "history_db",
+    "realtime_dashboard",
+    "realtime_port",
+    "ai_provider",
+    "ai_api_key",
+)
+
+# Real-time results are handed to a daemon thread so the dashboard's state
+# writes stay off the per-test reporting path; None is the stop sentinel.
+# The thread coalesces results for up to _SINK_BATCH_WINDOW seconds or
+# _SINK_BATCH_SIZE results and hands each batch over in one update
+_sink_queue: Optional[queue.SimpleQueue] = None
+_sink_thread: Optional[threading.Thread] = None
+_SINK_BATCH_WINDOW = 0.05
+_SINK_BATCH_SIZE = 32
+
+# Under pytest-xdist the realtime dashboard runs in the controller only, which
+# never sees makereport; it is fed from the reports the workers send back
+_realtime_from_logreport = False
+
+
+def _drain_sink(sink: queue.SimpleQueue, realtime_server) -> None:
+    """Forward queued test results to the real-time dashboard until stopped."""
+    update_test_results = realtime_server.update_test_results
+    stopping = False
+    while not stopping:
+        result = sink.get()
+        if result is None:
+            return
+
+        # Collect whatever else arrives within the batch window
+        batch = [result]
+        deadline = time.monotonic() + _SINK_BATCH_WINDOW
+        while len(batch) < _SINK_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                result = sink.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if result is None:
+                stopping = True
+                break
+            batch.append(result)
+
+        try:
+            update_test_results(batch)
+        except Exception:
+            pass  # Don't fail the run if real-time emission fails
+
+
+def _start_sink(realtime_server) -> None:
+    """Start the background thread that feeds the real-time dashboard."""
+    global _sink_queue, _sink_thread
+    _sink_queue = queue.SimpleQueue()
+    _sink_thread = threading.Thread(
+        target=_drain_sink, args=(_sink_queue, realtime_server),
+        name="dashboard-realtime-sink", daemon=True
+    )
+    _sink_thread.start()
 
-# Global state for collecting test results
-_test_results = {}
-_history_tracker: Optional[TestHistory] = None
+
+def _stop_sink() -> None:
+    """Flush the queued results and wait for the sink thread to finish."""
+    global _sink_queue, _sink_thread
+    if _sink_thread is None:
+        return
+    _sink_queue.put_nowait(None)
+    _sink_thread.join()
+    _sink_queue = _sink_thread = None
 
 
 def pytest_addoption(parser):
     """Add command-line options for pytest-dashboard."""
     group = parser.getgroup("dashboard", "Dashboard HTML Report")
 
+    group.addoption(
+        "--no-dashboard",
+        action="store_true",
+        dest="no_dashboard",
+        default=False,
+        help="Disable pytest-html-dashboard entirely for this run"
+    )
+
     # Branding options
     group.addoption(
         "--dashboard-company-name",
@@ -145,64 +253,82 @@ def pytest_addoption(parser):
 
 def pytest_configure(config):
     """Configure pytest-dashboard plugin."""
+    # Step out of the run before any state is set up, so no hook of this
+    # module is called again
+    if config.getoption("no_dashboard"):
+        config.pluginmanager.unregister(plugin=sys.modules[__name__])
+        return
+
+    # Read every CLI option once
+    opts = {name: config.getoption(name) for name in _CLI_OPTIONS}
+
     # Load configuration
-    config_file = config.getoption("dashboard_config")
+    config_file = opts["dashboard_config"]
     reporter_config = ReporterConfig.from_yaml(config_file)
 
     # Override with command-line options if provided
-    if config.getoption(
-            "dashboard_company_name") != "Test Automation Framework":
-        reporter_config.branding.company_name = config.getoption(
-            "dashboard_company_name")
-    if config.getoption(
-            "dashboard_report_title") != "Test Execution Dashboard":
-        reporter_config.branding.report_title = config.getoption(
-            "dashboard_report_title")
-    if config.getoption("dashboard_logo_url"):
-        reporter_config.branding.logo_url = config.getoption(
-            "dashboard_logo_url")
-
-    reporter_config.charts.enable_charts = config.getoption("dashboard_charts")
-    reporter_config.report.enable_error_classification = config.getoption(
-        "dashboard_error_classification")
+    if opts["dashboard_company_name"] != "Test Automation Framework":
+        reporter_config.branding.company_name = opts["dashboard_company_name"]
+    if opts["dashboard_report_title"] != "Test Execution Dashboard":
+        reporter_config.branding.report_title = opts["dashboard_report_title"]
+    if opts["dashboard_logo_url"]:
+        reporter_config.branding.logo_url = opts["dashboard_logo_url"]
+
+    reporter_config.charts.enable_charts = opts["dashboard_charts"]
+    reporter_config.report.enable_error_classification = opts[
+        "dashboard_error_classification"]
 
     # Override v1.2.0 feature options from CLI
-    if config.getoption("enable_history"):
+    if opts["enable_history"]:
         reporter_config.historical.enable_tracking = True
-    elif config.getoption("disable_history"):
+    elif opts["disable_history"]:
         reporter_config.historical.enable_tracking = False
 
-    if config.getoption("history_db"):
-        reporter_config.historical.database_path = config.getoption("history_db")
+    if opts["history_db"]:
+        reporter_config.historical.database_path = opts["history_db"]
 
-    if config.getoption("realtime_dashboard"):
+    if opts["realtime_dashboard"]:
         reporter_config.realtime.enable_realtime = True
-        reporter_config.realtime.websocket_port = config.getoption("realtime_port")
+        reporter_config.realtime.websocket_port = opts["realtime_port"]
 
-    if config.getoption("ai_provider"):
-        reporter_config.ai.provider = config.getoption("ai_provider")
+    if opts["ai_provider"]:
+        reporter_config.ai.provider = opts["ai_provider"]
 
-    if config.getoption("ai_api_key"):
-        reporter_config.ai.api_key = config.getoption("ai_api_key")
+    if opts["ai_api_key"]:
+        reporter_config.ai.api_key = opts["ai_api_key"]
 
     # Store configuration in pytest config for access by other hooks
     config._dashboard_config = reporter_config
-    config._dashboard_error_reporter = EnhancedErrorReporter()
+    # Created by the first failure that needs classifying; all-green runs
+    # never build one
+    config._dashboard_error_reporter = None
+
+    # The per-test hook reads its switches and the reporter from module
+    # globals, not config
+    global _collecting, _error_reporter, _classify_errors
+    _collecting = True
+    _error_reporter = None
+    _classify_errors = reporter_config.report.enable_error_classification
 
     # Initialize history tracker if enabled
     global _history_tracker
     if reporter_config.historical.enable_tracking:
         try:
+            from .history import TestHistory
             _history_tracker = TestHistory(
                 db_path=reporter_config.historical.database_path
             )
             config._dashboard_history_tracker = _history_tracker
         except Exception as e:
-            print(f"Warning: Failed to initialize history tracker: {e}")
+            _write_line(config, f"Warning: Failed to initialize history tracker: {e}", yellow=True)
             _history_tracker = None
 
-    # Initialize real-time dashboard if enabled
-    if reporter_config.realtime.enable_realtime:
+    # Initialize real-time dashboard if enabled. Only one process may own the
+    # port and the state files, so xdist workers leave it to the controller
+    global _realtime_from_logreport
+    config._dashboard_realtime = None
+    _realtime_from_logreport = False
+    if reporter_config.realtime.enable_realtime and not hasattr(config, "workerinput"):
         try:
             from .realtime import RealtimeDashboard
             realtime_server = RealtimeDashboard(
@@ -210,76 +336,94 @@ def pytest_configure(config):
             )
             realtime_server.start()
             config._dashboard_realtime = realtime_server
-            print(f"[Real-time Dashboard] WebSocket server started on port {reporter_config.realtime.websocket_port}")
+            _start_sink(realtime_server)
+            _realtime_from_logreport = getattr(config.option, "dist", "no") != "no"
+            _write_line(config, f"[Real-time Dashboard] WebSocket server started on port {reporter_config.realtime.websocket_port}")
         except Exception as e:
-            print(f"Warning: Failed to start real-time server: {e}")
+            _write_line(config, f"Warning: Failed to start real-time server: {e}", yellow=True)
             config._dashboard_realtime = None
 
     # Add metadata for pytest-html integration
     if hasattr(config, '_metadata'):
         config._metadata['Dashboard'] = 'pytest-html-dashboard v1.2.0'
 
+    # pytest-html hooks only matter when a report is being written
+    if getattr(config.option, 'htmlpath', None):
+        config.pluginmanager.register(PytestHtmlHooks(), "dashboard-pytest-html")
+
+
+class PytestHtmlHooks:
+    """pytest-html integration hooks, registered only when --html is given."""
+
+    def pytest_html_report_title(self, report):
+        """Customize the HTML report title."""
+        if hasattr(report.config, '_dashboard_config'):
+            config = report.config._dashboard_config
+            report.title = config.branding.report_title
+
+    def pytest_html_results_table_header(self, cells):
+        """Add custom columns to results table."""
+        cells.insert(2, '<th>Error Category</th>')
+        cells.insert(3, '<th>Error Type</th>')
 
-def pytest_html_report_title(report):
-    """Customize the HTML report title."""
-    if hasattr(report.config, '_dashboard_config'):
-        config = report.config._dashboard_config
-        report.title = config.branding.report_title
+    def pytest_html_results_table_row(self, report, cells):
+        """Add custom data to results table rows."""
+        # Add error category
+        error_category = getattr(report, 'dashboard_error_category', None)
+        cells.insert(2, _NA_CELL if error_category is None
+                     else _CELL_TMPL % escape(error_category))
+
+        # Add error type
+        error_type = getattr(report, 'dashboard_error_type', None)
+        cells.insert(3, _NA_CELL if error_type is None
+                     else _CELL_TMPL % escape(error_type))
+
+    def pytest_html_results_summary(self, prefix, summary, postfix):
+        """Add dashboard summary information."""
+        prefix.extend([
+            '<div class="dashboard-summary">',
+            '<h2>Dashboard Analytics</h2>',
+            '<p>Enhanced by pytest-dashboard</p>',
+            '</div>'
+        ])
 
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Capture test results and error information."""
-    global _history_tracker
     outcome = yield
     report = outcome.get_result()
 
-    if hasattr(item.config, '_dashboard_error_reporter'):
-        error_reporter = item.config._dashboard_error_reporter
-        realtime_server = getattr(item.config, '_dashboard_realtime', None)
+    if _collecting:
 
         # Store test result globally for HTML generation
         test_id = item.nodeid
 
+        # History is written in one batch from _test_results at session
+        # finish, so nothing touches the database on the per-test path
         if call.when == "call":
-            _test_results[test_id] = {
-                'nodeid': test_id,
-                'outcome': report.outcome,
-                'duration': getattr(report, 'duration', 0.0),
-                'failed': report.failed,
-                'passed': report.passed,
-                'skipped': report.skipped,
-            }
+            test_outcome = report.outcome
+            duration = getattr(report, 'duration', 0.0)
+            _test_results[test_id] = (test_outcome, duration, call.start, call.stop)
+
+            # Queue the real-time update; the sink thread applies it
+            if _sink_queue is not None:
+                _sink_queue.put_nowait({
+                    'test_name': item.name,
+                    'test_id': test_id,
+                    'outcome': test_outcome,
+                    'duration': duration,
+                })
 
-            # Emit real-time event if enabled
-            if realtime_server:
-                try:
-                    realtime_server.emit_test_result({
-                        'test_id': test_id,
-                        'outcome': report.outcome,
-                        'duration': getattr(report, 'duration', 0.0),
-                    })
-                except Exception as e:
-                    pass  # Don't fail tests if real-time emission fails
-
-            # Save to history database if enabled
-            if _history_tracker:
-                try:
-                    _history_tracker.save_test_result({
-                        'test_id': test_id,
-                        'outcome': report.outcome,
-                        'duration': getattr(report, 'duration', 0.0),
-                        'timestamp': time.time(),
-                    })
-                except Exception as e:
-                    pass  # Don't fail tests if history tracking fails
-
-        if report.failed and call.excinfo:
-            # Capture error information
+        if _classify_errors and report.failed and call.excinfo:
+            # Capture error information; the traceback is only rendered if
+            # the exception itself cannot be classified
+            excinfo = call.excinfo
+            error_reporter = _error_reporter or _create_error_reporter(item.config)
             error_info = error_reporter.capture_test_error(
                 test_id=test_id,
-                log_content=str(call.excinfo.getrepr()),
-                exception=call.excinfo.value
+                exception=excinfo.value,
+                get_log=lambda: str(excinfo.getrepr())
             )
 
             # Attach error classification to report
@@ -289,35 +433,61 @@ def pytest_runtest_makereport(item, call):
                 report.dashboard_suggested_action = error_info.suggested_action
 
 
-def pytest_html_results_table_header(cells):
-    """Add custom columns to results table."""
-    cells.insert(2, '<th>Error Category</th>')
-    cells.insert(3, '<th>Error Type</th>')
+def pytest_runtest_logreport(report):
+    """Feed the real-time dashboard from worker reports under pytest-xdist."""
+    if _realtime_from_logreport and report.when == "call" and _sink_queue is not None:
+        # The item name is the last node id segment; parameter ids may
+        # themselves contain "::"
+        path, bracket, params = report.nodeid.partition("[")
+        _sink_queue.put_nowait({
+            'test_name': path.rpartition("::")[2] + bracket + params,
+            'test_id': report.nodeid,
+            'outcome': report.outcome,
+            'duration': getattr(report, 'duration', 0.0),
+        })
 
 
-def pytest_html_results_table_row(report, cells):
-    """Add custom data to results table rows."""
-    # Add error category
-    if hasattr(report, 'dashboard_error_category'):
-        cells.insert(2, f'<td>{report.dashboard_error_category}</td>')
-    else:
-        cells.insert(2, '<td>N/A</td>')
+def _create_error_reporter(config) -> EnhancedErrorReporter:
+    """Build the error reporter on first use and publish it on config."""
+    global _error_reporter
+    _error_reporter = config._dashboard_error_reporter = EnhancedErrorReporter()
+    return _error_reporter
+
+
+def _write_line(config, message: str, **markup) -> None:
+    """Write a dashboard message through pytest's buffered terminal writer.
 
-    # Add error type
-    if hasattr(report, 'dashboard_error_type'):
-        cells.insert(3, f'<td>{report.dashboard_error_type}</td>')
+    Falls back to print() while the terminal reporter is not registered
+    (e.g. early in pytest_configure or with ``-p no:terminal``).
+    """
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is None:
+        print(message)
     else:
-        cells.insert(3, '<td>N/A</td>')
+        reporter.write_line(message, **markup)
+
 
+def _write_traceback(config) -> None:
+    """Show the current exception's traceback through the terminal writer."""
+    _write_line(config, traceback.format_exc().rstrip())
 
-def pytest_html_results_summary(prefix, summary, postfix):
-    """Add dashboard summary information."""
-    prefix.extend([
-        '<div class="dashboard-summary">',
-        '<h2>Dashboard Analytics</h2>',
-        '<p>Enhanced by pytest-dashboard</p>',
-        '</div>'
-    ])
+
+def _results_for_report() -> Dict[str, Dict[str, Any]]:
+    """Expand the collected result tuples into the record dicts the report
+    generator reads, once, at hand-off."""
+    return {
+        test_id: {
+            'nodeid': test_id,
+            'outcome': outcome,
+            'duration': duration,
+            'failed': outcome == 'failed',
+            'passed': outcome == 'passed',
+            'skipped': outcome == 'skipped',
+            'start': start,
+            'stop': stop,
+        }
+        for test_id, (outcome, duration, start, stop) in _test_results.items()
+    }
 
 
 def pytest_sessionstart(session):
@@ -325,10 +495,7 @@ def pytest_sessionstart(session):
     try:
         realtime_server = getattr(session.config, '_dashboard_realtime', None)
         if realtime_server:
-            realtime_server.emit_event('session_start', {
-                'timestamp': time.time(),
-                'message': 'Test session started'
-            })
+            realtime_server.update_progress('Test session started')
     except Exception as e:
         # Don't fail tests if real-time fails
         pass
@@ -341,32 +508,30 @@ def pytest_sessionfinish(session, exitstatus):
     # Save test run to history database
     if _history_tracker and _test_results:
         try:
-            # Calculate test statistics
-            passed = sum(1 for r in _test_results.values() if r.get('outcome') == 'passed')
-            failed = sum(1 for r in _test_results.values() if r.get('outcome') == 'failed')
-            skipped = sum(1 for r in _test_results.values() if r.get('outcome') == 'skipped')
-            errors = sum(1 for r in _test_results.values() if r.get('outcome') == 'error')
-            total_duration = sum(r.get('duration', 0) for r in _test_results.values())
-
-            # Convert test results dict to list format expected by save_test_run
+            # Count outcomes, total the durations and convert the results to
+            # the list format expected by save_test_run in a single pass
+            outcomes = Counter()
+            total_duration = 0.0
             tests_list = []
-            for test_id, result in _test_results.items():
+            for test_id, (outcome, duration, _, _) in _test_results.items():
+                outcomes[outcome] += 1
+                total_duration += duration
                 tests_list.append({
-                    'name': result.get('nodeid', test_id),
-                    'outcome': result.get('outcome', 'unknown'),
-                    'duration': result.get('duration', 0),
-                    'error_message': result.get('error_message', ''),
-                    'error_type': result.get('error_type', '')
+                    'name': test_id,
+                    'outcome': outcome,
+                    'duration': duration,
+                    'error_message': '',
+                    'error_type': ''
                 })
 
             # Prepare results dict for save_test_run
             results = {
                 'summary': {
                     'total': len(_test_results),
-                    'passed': passed,
-                    'failed': failed,
-                    'skipped': skipped,
-                    'errors': errors,
+                    'passed': outcomes['passed'],
+                    'failed': outcomes['failed'],
+                    'skipped': outcomes['skipped'],
+                    'errors': outcomes['error'],
                     'duration': total_duration
                 },
                 'tests': tests_list
@@ -374,33 +539,45 @@ def pytest_sessionfinish(session, exitstatus):
 
             # Save test run
             run_id = _history_tracker.save_test_run(results)
-            print(f"\n[Historical Tracking] Saved test run #{run_id} with {len(tests_list)} tests to database")
+            _write_line(session.config, f"\n[Historical Tracking] Saved test run #{run_id} with {len(tests_list)} tests to database")
 
         except Exception as e:
-            print(f"\nWarning: Failed to save historical data: {e}")
-            import traceback
-            traceback.print_exc()
+            _write_line(session.config, f"\nWarning: Failed to save historical data: {e}", yellow=True)
+            _write_traceback(session.config)
 
-    # Cleanup real-time server
+    # Cleanup real-time server once every queued result has been delivered
     try:
+        _stop_sink()
         realtime_server = getattr(session.config, '_dashboard_realtime', None)
         if realtime_server:
             # Emit finish event
-            realtime_server.emit_event('session_finish', {
-                'timestamp': time.time(),
-                'exitstatus': exitstatus,
-                'message': 'Test session finished'
-            })
-            # Give clients time to receive final events
-            time.sleep(0.5)
+            realtime_server.update_progress(
+                f'Test session finished (exit status {int(exitstatus)})'
+            )
             # Stop server
             realtime_server.stop()
-            print("[Real-time Dashboard] WebSocket server stopped")
+            _write_line(session.config, "[Real-time Dashboard] WebSocket server stopped")
     except Exception as e:
         # Don't fail tests if cleanup fails
         pass
 
 
+def _wait_for_stable_size(path: str, timeout: float = 0.5,
+                          interval: float = 0.02) -> None:
+    """Return once the file size stops changing between two polls.
+
+    A finished report returns after a single interval instead of a fixed
+    sleep; a file still being written is given up to ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    size = os.path.getsize(path)
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        previous, size = size, os.path.getsize(path)
+        if size == previous:
+            return
+
+
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
     """
     Post-process HTML report after ALL pytest operations complete.
@@ -410,8 +587,8 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
     html_path = getattr(config.option, 'htmlpath', None)
 
     if html_path and os.path.exists(html_path):
-        # Give pytest-html time to finish writing the file
-        time.sleep(0.5)
+        # Make sure pytest-html has finished writing the file
+        _wait_for_stable_size(html_path)
 
         try:
             # Get configuration and error reporter
@@ -420,33 +597,35 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
 
             if reporter_config and reporter_config.report.enable_enhanced_reporting:
                 # Enhance the HTML report with dashboard features
+                from .html_generator import enhance_html_report_dashboard
                 enhance_html_report_dashboard(
                     html_path=html_path,
                     config=reporter_config,
-                    test_results=_test_results,
-                    error_reporter=error_reporter
+                    test_results=_results_for_report(),
+                    error_reporter=error_reporter,
+                    warn=lambda message: terminalreporter.write_line(
+                        f"[WARNING] {message}", yellow=True)
                 )
-                print(
-                    f"\n[SUCCESS] Enhanced dashboard report generated: {html_path}")
+                terminalreporter.write_line(
+                    f"\n[SUCCESS] Enhanced dashboard report generated: {html_path}", green=True)
             else:
-                print(
-                    f"\n[WARNING] Enhanced reporting disabled. Basic report generated: {html_path}")
+                terminalreporter.write_line(
+                    f"\n[WARNING] Enhanced reporting disabled. Basic report generated: {html_path}",
+                    yellow=True)
 
         except Exception as e:
-            print(f"\n[WARNING] Could not enhance HTML report: {e}")
-            import traceback
-            traceback.print_exc()
+            terminalreporter.write_line(
+                f"\n[WARNING] Could not enhance HTML report: {e}", yellow=True)
+            _write_traceback(config)
     elif html_path:
-        print(f"\n[WARNING] HTML report file not found at: {html_path}")
+        terminalreporter.write_line(
+            f"\n[WARNING] HTML report file not found at: {html_path}", yellow=True)
 
 
 __all__ = [
     'pytest_addoption',
     'pytest_configure',
-    'pytest_html_report_title',
     'pytest_runtest_makereport',
-    'pytest_html_results_table_header',
-    'pytest_html_results_table_row',
-    'pytest_html_results_summary',
+    'PytestHtmlHooks',
     'pytest_terminal_summary',
 ]
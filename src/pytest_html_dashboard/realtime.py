@@ -1,12 +1,256 @@
 """Real-time test execution dashboard with WebSocket support."""
 
-import asyncio
+import functools
+import gzip
 import json
+import os
+import queue
 import threading
+import time
+import warnings
+from collections import deque
 from datetime import datetime
-from pathlib import Path
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, List, Optional, Set
-import socket
+
+# State-file writes are coalesced: the writer thread waits this long after the
+# first change so a burst of updates lands in a single write
+_STATE_FLUSH_INTERVAL = 0.2
+
+# Polling clients read the full state; every broadcast is also appended as one
+# line to the events log so a client can follow just the tail
+_STATE_FILE = "realtime-state.json"
+_EVENTS_FILE = "realtime-events.jsonl"
+# A few bytes holding the state version; idle pollers read only this
+_VERSION_FILE = "realtime-version.txt"
+# Server-sent events stream pushing each broadcast to connected clients
+_UPDATES_PATH = "updates"
+# Idle streams send a comment this often so closed clients are noticed
+_KEEPALIVE_INTERVAL = 15.0
+# Origin browsers send for a report opened from disk (file://); it is the
+# only cross-origin page allowed to read from the server
+_REPORT_ORIGIN = "null"
+
+# Only the most recent tests are kept in the state; the full sequence is in
+# the events log, so memory and state-file size stay flat for large suites
+_RECENT_TESTS = 500
+
+
+# Outcomes that have their own counter in the summary
+_COUNTED_OUTCOMES = frozenset(("passed", "failed", "skipped"))
+
+
+# Results-table row sent with each test event, so the client inserts ready
+# markup instead of assembling it per test
+_ROW_TMPL = (
+    '<tr class="result %s"><td>%s</td>'
+    '<td><span class="badge %s">%s</span></td>'
+    '<td>%.2fs</td><td>%s</td></tr>'
+)
+
+# Running-test indicator sent with test_start events
+_RUNNING_TMPL = (
+    '<div class="running-test"><span class="spinner">⟳</span>'
+    '<span>Running: %s</span></div>'
+)
+
+
+def _render_row(test: Dict[str, Any]) -> str:
+    """Render one completed test as a results-table row."""
+    outcome = escape(test["outcome"])
+    return _ROW_TMPL % (
+        outcome, escape(test["name"]), outcome, outcome,
+        test["duration"], test["timestamp"]
+    )
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write data to path via a temporary file so readers never see a partial file."""
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+# Compact separators keep both files small without changing their content
+_dumps = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def _encode_event(message: Dict[str, Any]) -> bytes:
+    """Serialize a broadcast message once for the log and every client."""
+    return _dumps(message).encode()
+
+
+# Bound once for the per-event paths
+_now = datetime.now
+
+
+class _StateRequestHandler(BaseHTTPRequestHandler):
+    """Serve the dashboard's state, version and events log over HTTP.
+
+    State and version come from the snapshot the writer keeps in memory; the
+    events log is read from disk and honours single byte-range requests.
+    """
+
+    def do_GET(self):
+        dashboard = self.server.dashboard
+        dashboard._note_consumer()
+        path = self.path.split("?", 1)[0].lstrip("/")
+        version, payload, payload_gz = dashboard._snapshot
+
+        if path == _VERSION_FILE:
+            self._send_body(str(version).encode(), "text/plain")
+        elif path == _STATE_FILE:
+            if payload is None:
+                self._send_empty(404)
+                return
+            etag = f'"{version}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send_empty(304, etag)
+                return
+            # Compressed once per version by the writer, reused for every client
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                self._send_body(
+                    payload_gz, "application/json", etag=etag, encoding="gzip"
+                )
+            else:
+                self._send_body(payload, "application/json", etag=etag)
+        elif path == _EVENTS_FILE:
+            self._send_events()
+        elif path == _UPDATES_PATH:
+            self._stream_updates(dashboard)
+        else:
+            self._send_empty(404)
+
+    def do_OPTIONS(self):
+        # Preflight for the Range header the client sends for the events log
+        if self.headers.get("Origin") != _REPORT_ORIGIN:
+            self._send_empty(403)
+            return
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Methods", "GET")
+        self.send_header("Access-Control-Allow-Headers", "Range")
+        self.send_header("Access-Control-Max-Age", "600")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def end_headers(self):
+        # Only a report opened from disk may read responses cross-origin
+        if self.headers.get("Origin") == _REPORT_ORIGIN:
+            self.send_header("Access-Control-Allow-Origin", _REPORT_ORIGIN)
+        self.send_header("Vary", "Origin")
+        super().end_headers()
+
+    def _stream_updates(self, dashboard: "RealtimeDashboard"):
+        """Push each broadcast to this client as a server-sent event."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+
+        client = dashboard._add_client()
+        try:
+            while True:
+                try:
+                    line = client.get(timeout=_KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                    continue
+
+                # Send everything already queued in one write
+                chunks = []
+                while line is not None:
+                    chunks.append(b"data: " + line + b"\n\n")
+                    try:
+                        line = client.get_nowait()
+                    except queue.Empty:
+                        break
+                if chunks:
+                    self.wfile.write(b"".join(chunks))
+                if line is None:
+                    return
+        except OSError:
+            pass  # Client went away
+        finally:
+            dashboard._remove_client(client)
+
+    def _send_events(self):
+        """Send the events log, or the part a Range header asks for."""
+        start = 0
+        range_header = self.headers.get("Range", "")
+        if range_header.startswith("bytes=") and range_header.endswith("-"):
+            try:
+                start = int(range_header[6:-1])
+            except ValueError:
+                start = 0
+        try:
+            with open(self.server.dashboard._events_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if start and start >= size:
+                    self._send_empty(416)
+                    return
+                f.seek(start)
+                data = f.read(size - start)
+        except OSError:
+            self._send_empty(404)
+            return
+
+        if not start:
+            self._send_body(data, "application/x-ndjson")
+            return
+        self.send_response(206)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header(
+            "Content-Range", f"bytes {start}-{start + len(data) - 1}/{size}"
+        )
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_body(
+        self,
+        body: bytes,
+        content_type: str,
+        etag: Optional[str] = None,
+        encoding: Optional[str] = None
+    ):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Cache-Control", "no-store")
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_empty(self, status: int, etag: Optional[str] = None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass  # Keep request logging out of the test output
+
+
+class _StateHTTPServer(ThreadingHTTPServer):
+    """HTTP server for the dashboard state, one thread per request.
+
+    The port is bound exclusively: a single process owns the state it serves.
+    """
+
+    daemon_threads = True
 
 
 class RealtimeDashboard:
@@ -17,14 +261,17 @@ class RealtimeDashboard:
 
         Args:
             port: WebSocket server port
-            enable_websocket: Whether to enable WebSocket server
+            enable_websocket: Whether to enable WebSocket server; when
+                disabled, test updates are ignored
         """
         self.port = port
         self.enable_websocket = enable_websocket
-        self.clients: Set = set()
-        self.current_state: Dict[str, Any] = {
+        # One queue per connected stream client, fed by _broadcast
+        self.clients: Set[queue.SimpleQueue] = set()
+        # Internal state; readers get list-based snapshots from
+        # _state_snapshot, never these containers
+        self._state: Dict[str, Any] = {
             "status": "idle",
-            "tests": [],
             "summary": {
                 "total": 0,
                 "passed": 0,
@@ -35,8 +282,36 @@ class RealtimeDashboard:
             "current_test": None,
             "start_time": None
         }
+        # The summary is never replaced, so the hot update path binds it once;
+        # the most recent tests are kept in a bounded deque
+        self._summary = self._state["summary"]
+        self._tests: deque = deque(maxlen=_RECENT_TESTS)
         self.server_thread: Optional[threading.Thread] = None
         self.running = False
+        # Guards the state: tests update it from the reporting thread
+        # while the writer thread serializes it. Re-entrant because updates
+        # broadcast, and a broadcast may write the state synchronously
+        self._lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._events_file = None
+        # Bytes written to the events log; the state file records it so a
+        # client can continue from the matching point in the log
+        self._events_offset = 0
+        # Bumped on every broadcast so pollers can detect change cheaply
+        self._version = 0
+        # Latest (version, encoded state, gzipped state) written, served by
+        # the HTTP server
+        self._snapshot = (0, None, None)
+        self._httpd: Optional[_StateHTTPServer] = None
+        # Set on the first request to the server, which builds the served
+        # snapshot; until then the writer skips building it
+        self._consumer_seen = threading.Event()
+        # Resolved once, so a later change of working directory does not
+        # move where the files are written
+        self._state_path = os.path.abspath(_STATE_FILE)
+        self._version_path = os.path.abspath(_VERSION_FILE)
+        self._events_path = os.path.abspath(_EVENTS_FILE)
 
     def start(self):
         """Start the real-time dashboard server."""
@@ -44,8 +319,8 @@ class RealtimeDashboard:
             return
 
         self.running = True
-        self.current_state["status"] = "running"
-        self.current_state["start_time"] = datetime.now().isoformat()
+        self._state["status"] = "running"
+        self._state["start_time"] = _now().isoformat()
 
         # Start WebSocket server in background thread
         self.server_thread = threading.Thread(
@@ -53,11 +328,42 @@ class RealtimeDashboard:
         )
         self.server_thread.start()
 
+        # Start a fresh events log for this run, unbuffered so each
+        # appended event is visible to readers as soon as it is written
+        self._events_offset = 0
+        try:
+            self._events_file = open(self._events_path, 'wb', buffering=0)
+        except OSError:
+            self._events_file = None
+
+        # Start the debounced state-file writer
+        self._writer_thread = threading.Thread(
+            target=self._write_loop, daemon=True
+        )
+        self._writer_thread.start()
+
     def stop(self):
         """Stop the real-time dashboard server."""
         self.running = False
-        self.current_state["status"] = "completed"
-        self._broadcast({"type": "session_end", "data": self.current_state})
+
+        # Let the writer exit, then write the final state synchronously
+        if self._writer_thread is not None:
+            self._dirty.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+        with self._lock:
+            self._state["status"] = "completed"
+            self._broadcast(_encode_event(
+                {"type": "session_end", "data": self._state_snapshot()}
+            ))
+
+            # End every open stream after the final event
+            for client in self.clients:
+                client.put_nowait(None)
+
+        if self._events_file is not None:
+            self._events_file.close()
+            self._events_file = None
 
     def update_test_start(self, test_name: str, test_id: str):
         """Notify that a test has started.
@@ -66,22 +372,28 @@ class RealtimeDashboard:
             test_name: Name of the test
             test_id: Unique test identifier
         """
-        self.current_state["current_test"] = {
-            "name": test_name,
-            "id": test_id,
-            "status": "running",
-            "start_time": datetime.now().isoformat()
-        }
-        self.current_state["summary"]["running"] += 1
-
-        self._broadcast({
-            "type": "test_start",
-            "data": {
-                "test_name": test_name,
-                "test_id": test_id,
-                "timestamp": datetime.now().isoformat()
+        if not self.enable_websocket:
+            return
+
+        timestamp = _now().isoformat()
+        with self._lock:
+            self._state["current_test"] = {
+                "name": test_name,
+                "id": test_id,
+                "status": "running",
+                "start_time": timestamp
             }
-        })
+            self._summary["running"] += 1
+
+            self._broadcast(_encode_event({
+                "type": "test_start",
+                "data": {
+                    "test_name": test_name,
+                    "test_id": test_id,
+                    "timestamp": timestamp
+                },
+                "html": _RUNNING_TMPL % escape(test_name)
+            }))
 
     def update_test_end(
         self,
@@ -100,18 +412,67 @@ class RealtimeDashboard:
             duration: Test duration in seconds
             error: Error message if test failed
         """
+        if not self.enable_websocket:
+            return
+
+        timestamp = _now().isoformat()
+        with self._lock:
+            test_result = self._record_test_end(
+                timestamp, test_name, test_id, outcome, duration, error
+            )
+
+            # Broadcast update
+            self._broadcast(_encode_event({
+                "type": "test_end",
+                "data": test_result,
+                "html": _render_row(test_result),
+                "summary": self._summary
+            }))
+
+    def update_test_results(self, results: List[Dict[str, Any]]):
+        """Record a batch of completed tests and broadcast them once.
+
+        Args:
+            results: Keyword arguments for update_test_end, one dict per test
+        """
+        if not results or not self.enable_websocket:
+            return
+
+        # A batch is drained within one short window, so its tests share
+        # a single timestamp
+        timestamp = _now().isoformat()
+        with self._lock:
+            record = self._record_test_end
+            tests = [record(timestamp, **result) for result in results]
+
+            # Newest first, matching the order rows are shown in
+            self._broadcast(_encode_event({
+                "type": "test_batch",
+                "data": tests,
+                "html": "".join(map(_render_row, reversed(tests))),
+                "summary": self._summary
+            }))
+
+    def _record_test_end(
+        self,
+        timestamp: str,
+        test_name: str,
+        test_id: str,
+        outcome: str,
+        duration: float,
+        error: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Apply a completed test to the state and return its entry.
+
+        The caller must hold the state lock.
+        """
         # Update summary
-        if outcome == "passed":
-            self.current_state["summary"]["passed"] += 1
-        elif outcome == "failed":
-            self.current_state["summary"]["failed"] += 1
-        elif outcome == "skipped":
-            self.current_state["summary"]["skipped"] += 1
-
-        self.current_state["summary"]["running"] = max(
-            0, self.current_state["summary"]["running"] - 1
-        )
-        self.current_state["summary"]["total"] += 1
+        summary = self._summary
+        if outcome in _COUNTED_OUTCOMES:
+            summary[outcome] += 1
+        if summary["running"]:
+            summary["running"] -= 1
+        summary["total"] += 1
 
         # Add to test list
         test_result = {
@@ -120,16 +481,10 @@ class RealtimeDashboard:
             "outcome": outcome,
             "duration": duration,
             "error": error,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
-        self.current_state["tests"].append(test_result)
-
-        # Broadcast update
-        self._broadcast({
-            "type": "test_end",
-            "data": test_result,
-            "summary": self.current_state["summary"]
-        })
+        self._tests.append(test_result)
+        return test_result
 
     def update_progress(self, message: str):
         """Send a progress update message.
@@ -137,51 +492,180 @@ class RealtimeDashboard:
         Args:
             message: Progress message
         """
-        self._broadcast({
-            "type": "progress",
-            "data": {
-                "message": message,
-                "timestamp": datetime.now().isoformat()
+        if not self.enable_websocket:
+            return
+
+        timestamp = _now().isoformat()
+        with self._lock:
+            self._broadcast(_encode_event({
+                "type": "progress",
+                "data": {
+                    "message": message,
+                    "timestamp": timestamp
+                }
+            }))
+
+    @property
+    def current_state(self) -> Dict[str, Any]:
+        """Deprecated: snapshot of the full state, with the recent tests as a list.
+
+        Writes to the returned dict do not reach the dashboard.
+        """
+        warnings.warn(
+            "RealtimeDashboard.current_state is deprecated; use get_state() "
+            "for status and summary",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._state_snapshot()
+
+    def _state_snapshot(self) -> Dict[str, Any]:
+        """Copy the state under the lock into plain dicts and lists."""
+        with self._lock:
+            current_test = self._state["current_test"]
+            return {
+                "status": self._state["status"],
+                "tests": list(self._tests),
+                "summary": dict(self._summary),
+                "current_test": dict(current_test) if current_test else None,
+                "start_time": self._state["start_time"],
             }
-        })
 
     def get_state(self) -> Dict[str, Any]:
         """Get current dashboard state.
 
         Returns:
-            Current state dictionary
+            Status, summary, current test and start time, copied shallowly
+            under the lock; the recent tests are in the state file and the
+            events log
         """
-        return self.current_state.copy()
+        with self._lock:
+            return dict(self._state, summary=self._summary.copy())
 
-    def _broadcast(self, message: Dict[str, Any]):
+    def _broadcast(self, payload: bytes):
         """Broadcast message to all connected clients.
 
+        Called with the state lock held.
+
         Args:
-            message: Message to broadcast
+            payload: Message to broadcast, already encoded by _encode_event
         """
         if not self.enable_websocket:
             return
 
-        # Store for HTTP polling fallback
-        self._save_state_file()
+        self._version += 1
+
+        # Append the event itself and push it to stream clients; both use
+        # the same bytes, so no client costs another serialization
+        if self._events_file is not None:
+            self._append_event(payload)
+        for client in self.clients:
+            client.put_nowait(payload)
+
+        # Store for HTTP polling fallback; while the writer thread runs it
+        # picks the change up, otherwise write straight away
+        if self._writer_thread is not None:
+            self._dirty.set()
+        else:
+            self._save_state_file()
+
+    def _write_loop(self):
+        """Write the state file at most once per flush interval."""
+        while self.running:
+            self._dirty.wait()
+            if not self.running:
+                return
+            time.sleep(_STATE_FLUSH_INTERVAL)
+            self._dirty.clear()
+            self._save_state_file()
+
+    def _add_client(self) -> queue.SimpleQueue:
+        """Register a stream client and return the queue it reads from."""
+        client = queue.SimpleQueue()
+        with self._lock:
+            self.clients.add(client)
+        return client
+
+    def _remove_client(self, client: queue.SimpleQueue):
+        """Forget a stream client once its connection ends."""
+        with self._lock:
+            self.clients.discard(client)
+
+    def _note_consumer(self):
+        """Record that a client is polling and build the served snapshot.
+
+        The snapshot is built before the first request is answered, so it is
+        served even when the writer thread has already exited.
+        """
+        if self._consumer_seen.is_set():
+            return
+        with self._lock:
+            if not self._consumer_seen.is_set():
+                self._consumer_seen.set()
+                self._publish_snapshot(*self._encode_state())
+
+    def _append_event(self, payload: bytes):
+        """Append one encoded event to the events log as a single line."""
+        line = payload + b"\n"
+        try:
+            self._events_file.write(line)
+            self._events_offset += len(line)
+        except Exception:
+            pass  # Fail silently if can't write
 
     def _save_state_file(self):
         """Save current state to file for HTTP polling fallback."""
-        state_file = Path("realtime-state.json")
         try:
-            with open(state_file, 'w') as f:
-                json.dump({
-                    "timestamp": datetime.now().isoformat(),
-                    "state": self.current_state
-                }, f)
+            # Serialize under the lock so the state is captured as a whole,
+            # then write the file without holding it
+            version, payload_bytes = self._encode_state()
+            _write_atomic(self._state_path, payload_bytes)
+
+            # Publish the version only once its state is on disk
+            _write_atomic(self._version_path, str(version).encode())
+
+            # The files may be read through any static server, so they are
+            # always written; the served copy is only kept once a client
+            # has asked this process for it
+            if self._consumer_seen.is_set():
+                self._publish_snapshot(version, payload_bytes)
         except Exception:
             pass  # Fail silently if can't write
 
+    def _encode_state(self):
+        """Serialize the state file payload and return it with its version."""
+        timestamp = _now().isoformat()
+        with self._lock:
+            version = self._version
+            payload = _dumps({
+                "timestamp": timestamp,
+                "version": version,
+                "events_offset": self._events_offset,
+                "state": self._state_snapshot()
+            })
+        return version, payload.encode()
+
+    def _publish_snapshot(self, version: int, payload_bytes: bytes):
+        """Replace the served snapshot unless a newer one is already served."""
+        payload_gz = gzip.compress(payload_bytes, compresslevel=1)
+        with self._lock:
+            if version >= self._snapshot[0]:
+                self._snapshot = (version, payload_bytes, payload_gz)
+
     def _run_server(self):
-        """Run simple HTTP server for state polling."""
-        # Simple HTTP server for JSON state
-        # This is a basic implementation - for production use Flask/FastAPI
-        pass
+        """Run the HTTP server that polling clients read the state from.
+
+        The thread is a daemon, so the final state stays available until the
+        pytest process exits.
+        """
+        try:
+            self._httpd = _StateHTTPServer(
+                ("localhost", self.port), _StateRequestHandler
+            )
+        except OSError:
+            return  # Port unavailable; the state files remain for polling
+        self._httpd.dashboard = self
+        self._httpd.serve_forever()
 
     def generate_realtime_html(self) -> str:
         """Generate HTML with real-time update capabilities.
@@ -189,102 +673,212 @@ class RealtimeDashboard:
         Returns:
             HTML string with WebSocket client code
         """
-        return f"""
+        return _render_realtime_html(self.port, self.enable_websocket)
+
+
+# Client script, styles and indicators for the live dashboard; braces are
+# doubled for str.format
+_REALTIME_HTML_TEMPLATE = """
 <!-- Real-Time Dashboard Updates -->
 <script>
-    let realtimeEnabled = {'true' if self.enable_websocket else 'false'};
-    let pollInterval = null;
+    let realtimeEnabled = {enabled};
+    let pollTimer = null;
+    let polling = false;
+
+    // Poll quickly while results keep changing, back off when they do not
+    const POLL_MIN_MS = 500;
+    const POLL_MAX_MS = 10000;
+    const POLL_BACKOFF = 1.5;
+    // State, version, events log and update stream are served by the
+    // dashboard process; it accepts cross-origin reads only from reports
+    // opened from disk
+    const STATE_BASE_URL = 'http://localhost:{port}/';
 
     function initRealtimeUpdates() {{
         if (!realtimeEnabled) return;
 
-        // Try WebSocket first, fallback to polling
-        try {{
-            connectWebSocket();
-        }} catch (e) {{
+        // Try the pushed event stream first, fallback to polling
+        if (typeof EventSource === 'undefined') {{
             startPolling();
+            return;
         }}
+        connectEventStream();
     }}
 
-    function connectWebSocket() {{
-        const ws = new WebSocket('ws://localhost:{self.port}/updates');
+    function connectEventStream() {{
+        const source = new EventSource(STATE_BASE_URL + 'updates');
 
-        ws.onopen = function() {{
+        source.onopen = function() {{
             console.log('Real-time connection established');
             showRealtimeIndicator(true);
+            // Events only carry changes; start from the current totals
+            fetch(STATE_BASE_URL + 'realtime-state.json', {{ cache: 'no-store' }})
+                .then(response => response.json())
+                .then(data => applyPolledState(data.state))
+                .catch(() => {{}});
         }};
 
-        ws.onmessage = function(event) {{
+        source.onmessage = function(event) {{
             const data = JSON.parse(event.data);
+            if (data.type === 'session_end') {{
+                source.close();
+                showRealtimeIndicator(false);
+            }}
             handleRealtimeUpdate(data);
         }};
 
-        ws.onclose = function() {{
+        source.onerror = function() {{
+            // Stream unavailable or dropped; fallback to polling
             console.log('Real-time connection closed');
+            source.close();
             showRealtimeIndicator(false);
-            // Fallback to polling
-            setTimeout(startPolling, 1000);
-        }};
-
-        ws.onerror = function() {{
-            // Fallback to polling
             startPolling();
         }};
     }}
 
     function startPolling() {{
-        if (pollInterval) return;
+        if (polling) return;
+        polling = true;
+
+        let interval = POLL_MIN_MS;
+        let lastVersion = null;
+        // Byte offset into the events log; null until the full state is loaded
+        let eventsOffset = null;
+
+        async function loadState() {{
+            const response = await fetch(STATE_BASE_URL + 'realtime-state.json', {{ cache: 'no-store' }});
+            const data = await response.json();
+            eventsOffset = data.events_offset;
+            applyPolledState(data.state);
+            return data.version;
+        }}
+
+        // Fetch only the events appended since the last poll and apply them
+        async function loadEvents() {{
+            const response = await fetch(STATE_BASE_URL + 'realtime-events.jsonl', {{
+                cache: 'no-store',
+                headers: {{ 'Range': 'bytes=' + eventsOffset + '-' }}
+            }});
+            if (response.status === 416) return;
+            if (!response.ok) throw new Error('events log unavailable');
+            let bytes = new Uint8Array(await response.arrayBuffer());
+            if (response.status !== 206) {{
+                bytes = bytes.subarray(eventsOffset);
+            }}
+            // Apply complete lines only; a partial last line is read next time
+            const end = bytes.lastIndexOf(10) + 1;
+            if (end === 0) return;
+            eventsOffset += end;
+            const lines = new TextDecoder().decode(bytes.subarray(0, end)).split('\\n');
+            for (const line of lines) {{
+                if (line) handleRealtimeUpdate(JSON.parse(line));
+            }}
+        }}
 
-        pollInterval = setInterval(async function() {{
+        async function poll() {{
             try {{
-                const response = await fetch('realtime-state.json');
-                const data = await response.json();
-                handleRealtimeUpdate(data.state);
+                // Check the small version file first; fetch the full state
+                // only when it has moved on
+                const versionResponse = await fetch(STATE_BASE_URL + 'realtime-version.txt', {{ cache: 'no-store' }});
+                const version = parseInt(await versionResponse.text(), 10);
+                if (version !== lastVersion) {{
+                    if (eventsOffset === null) {{
+                        lastVersion = await loadState();
+                    }} else {{
+                        try {{
+                            await loadEvents();
+                            lastVersion = version;
+                        }} catch (e) {{
+                            lastVersion = await loadState();
+                        }}
+                    }}
+                    interval = POLL_MIN_MS;
+                }} else {{
+                    interval = Math.min(interval * POLL_BACKOFF, POLL_MAX_MS);
+                }}
             }} catch (e) {{
                 // State file not available yet
+                interval = Math.min(interval * POLL_BACKOFF, POLL_MAX_MS);
             }}
-        }}, 2000); // Poll every 2 seconds
+            if (polling) {{
+                pollTimer = setTimeout(poll, interval);
+            }}
+        }}
+
+        poll();
     }}
 
+    function applyPolledState(state) {{
+        updateSummary(state.summary);
+        updateCharts(state.summary);
+        if (state.status === 'completed') {{
+            stopPolling();
+            showCompletionMessage();
+        }}
+    }}
+
+    // Updates are queued and applied together on the next animation frame,
+    // so a burst of events costs one insert and one summary refresh
+    let pendingRows = [];
+    let pendingSummary = null;
+    let pendingRunning = null;
+    let pendingEnd = false;
+    let flushScheduled = false;
+
     function handleRealtimeUpdate(data) {{
         if (data.type === 'test_start') {{
-            updateRunningTest(data.data);
-        }} else if (data.type === 'test_end') {{
-            updateTestResult(data.data);
-            updateSummary(data.summary);
-            updateCharts(data.summary);
+            pendingRunning = data.html;
+        }} else if (data.type === 'test_end' || data.type === 'test_batch') {{
+            pendingRows.push(data.html);
+            pendingSummary = data.summary;
         }} else if (data.type === 'session_end') {{
             stopPolling();
+            pendingEnd = true;
+        }} else {{
+            return;
+        }}
+        if (!flushScheduled) {{
+            flushScheduled = true;
+            requestAnimationFrame(flushPending);
+        }}
+    }}
+
+    function flushPending() {{
+        flushScheduled = false;
+        if (pendingRunning) {{
+            updateRunningTest(pendingRunning);
+            pendingRunning = null;
+        }}
+        if (pendingRows.length) {{
+            // Later events hold newer rows, which go on top
+            insertTestRows(pendingRows.reverse().join(''));
+            pendingRows = [];
+        }}
+        if (pendingSummary) {{
+            updateSummary(pendingSummary);
+            updateCharts(pendingSummary);
+            pendingSummary = null;
+        }}
+        if (pendingEnd) {{
+            pendingEnd = false;
             showCompletionMessage();
         }}
     }}
 
-    function updateRunningTest(test) {{
+    function updateRunningTest(html) {{
+        // The indicator arrives rendered and escaped by the server
         const indicator = document.getElementById('current-test-indicator');
         if (indicator) {{
-            indicator.innerHTML = `
-                <div class="running-test">
-                    <span class="spinner">⟳</span>
-                    <span>Running: ${{test.test_name}}</span>
-                </div>
-            `;
+            indicator.innerHTML = html;
             indicator.style.display = 'block';
         }}
     }}
 
-    function updateTestResult(test) {{
-        // Add new row to test table
+    function insertTestRows(html) {{
+        // Rows arrive rendered, newest first; add them to the top of the table
         const tableBody = document.querySelector('.results-table tbody');
-        if (tableBody) {{
-            const row = document.createElement('tr');
-            row.className = 'result ' + test.outcome;
-            row.innerHTML = `
-                <td>${{test.name}}</td>
-                <td><span class="badge ${{test.outcome}}">${{test.outcome}}</span></td>
-                <td>${{test.duration.toFixed(2)}}s</td>
-                <td>${{test.timestamp}}</td>
-            `;
-            tableBody.insertBefore(row, tableBody.firstChild);
+        if (tableBody && html) {{
+            tableBody.insertAdjacentHTML('afterbegin', html);
         }}
     }}
 
@@ -331,9 +925,10 @@ class RealtimeDashboard:
     }}
 
     function stopPolling() {{
-        if (pollInterval) {{
-            clearInterval(pollInterval);
-            pollInterval = null;
+        polling = false;
+        if (pollTimer) {{
+            clearTimeout(pollTimer);
+            pollTimer = null;
         }}
     }}
 
@@ -412,6 +1007,14 @@ class RealtimeDashboard:
 """
 
 
+@functools.lru_cache(maxsize=8)
+def _render_realtime_html(port: int, enable_websocket: bool) -> str:
+    """Fill the real-time template for one port/enabled combination."""
+    return _REALTIME_HTML_TEMPLATE.format(
+        port=port, enabled='true' if enable_websocket else 'false'
+    )
+
+
 # Global instance
 _realtime_dashboard: Optional[RealtimeDashboard] = None
 